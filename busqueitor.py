@@ -14,9 +14,9 @@ import csv
 # Documentación: https://docs.python.org/3/library/logging.html
 import logging
 
-# Importar List y Dict de typing para tipado estático
+# Importar List, Dict, Callable, Tuple, Any, Union, BinaryIO e Iterator de typing para tipado estático
 # Documentación: https://docs.python.org/3/library/typing.html
-from typing import List, Dict
+from typing import List, Dict, Callable, Tuple, Any, Union, BinaryIO, Iterator
 
 # Importar Path de pathlib para manejo de rutas de archivos
 # Documentación: https://docs.python.org/3/library/pathlib.html
@@ -26,17 +26,8 @@ from pathlib import Path
 # Documentación: https://docs.python.org/3/library/datetime.html
 from datetime import datetime
 
-# Importar requests para realizar peticiones HTTP
-# Documentación: https://docs.python-requests.org/en/latest/
-import requests
-
-# Importar pdfplumber para extraer texto de PDFs (método principal)
-# Documentación: https://github.com/jsvine/pdfplumber
-import pdfplumber
-
-# Importar PyPDF2 para extraer texto de PDFs (método alternativo)
-# Documentación: https://pypdf2.readthedocs.io/en/latest/
-from PyPDF2 import PdfFileReader
+# requests, pdfplumber y pypdfium2 se importan dentro de los métodos que los usan,
+# para que el menú aparezca sin esperar a cargar estas librerías pesadas
 
 # Importar init, Fore y Style de colorama para colorear la salida en terminal
 # Documentación: https://pypi.org/project/colorama/
@@ -46,6 +37,38 @@ from colorama import init, Fore, Style
 # Documentación: https://docs.python.org/3/library/os.html
 import os
 
+# Importar io para mantener en memoria los PDF descargados
+# Documentación: https://docs.python.org/3/library/io.html
+import io
+
+# Importar shutil para copiar la descarga al disco por bloques
+# Documentación: https://docs.python.org/3/library/shutil.html
+import shutil
+
+# Importar sys para escribir en la terminal en bloque
+# Documentación: https://docs.python.org/3/library/sys.html
+import sys
+
+# Importar time para limitar la frecuencia de los mensajes de progreso
+# Documentación: https://docs.python.org/3/library/time.html
+import time
+
+# Importar threading para mantener un manejador de PDF independiente por hilo
+# Documentación: https://docs.python.org/3/library/threading.html
+import threading
+
+# Importar ThreadPoolExecutor y ProcessPoolExecutor para procesar páginas y archivos en paralelo
+# Documentación: https://docs.python.org/3/library/concurrent.futures.html
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+# Importar queue para comunicar la extracción de páginas con la búsqueda de documentos
+# Documentación: https://docs.python.org/3/library/queue.html
+import queue
+
+# Importar deque para limitar las páginas extraídas en vuelo
+# Documentación: https://docs.python.org/3/library/collections.html#collections.deque
+from collections import deque
+
 # Inicializar colorama para soporte multiplataforma de texto coloreado en terminal
 init()
 
@@ -64,6 +87,7 @@ class DocumentValidator:
         PATRON_NIE (str): Patrón regex para identificar un NIE.
         PATRON_NIF (str): Patrón regex para identificar un NIF.
         stats (dict): Diccionario para almacenar estadísticas del procesamiento de documentos.
+        session (requests.Session): Sesión HTTP reutilizada por las descargas.
     Métodos:
         clean_document(doc: str) -> str:
             Limpia un documento eliminando espacios, puntos y guiones, y lo convierte a mayúsculas.
@@ -73,18 +97,34 @@ class DocumentValidator:
             Valida un NIE español.
         validate_nif(nif: str) -> bool:
             Valida un NIF español.
-        download_pdf(url: str, output_path: str) -> bool:
-            Descarga un archivo PDF desde una URL y lo guarda en la ruta especificada.
-        process_pdf(source: str, is_url: bool = False) -> List[Dict]:
+        download_pdf(url: str, output_path: Union[str, BinaryIO]) -> bool:
+            Descarga un archivo PDF desde una URL y lo guarda en la ruta o el objeto de archivo especificado.
+        process_pdf(source: str, is_url: bool = False, max_hilos: int = 1, verbose: bool = True) -> List[Dict]:
             Procesa un archivo PDF para extraer y validar documentos de identidad españoles.
-        save_results(resultados: List[Dict], archivo: str):
+        save_results(resultados: List[Dict], archivo: str, verbose: bool = False):
             Guarda los resultados del procesamiento en un archivo CSV.
     """
 
-    LETRAS_VALIDACION = 'TRWAGMYFPDXBNJZSQVHLCKET'
+    LETRAS_VALIDACION = 'TRWAGMYFPDXBNJZSQVHLCKE'
+    _LETRAS = LETRAS_VALIDACION.encode('ascii')
     PATRON_DNI = r'\b\d{8}[A-Z]\b'
     PATRON_NIE = r'\b[XYZ]\d{7}[A-Z]\b'
     PATRON_NIF = r'\b[A-HJNP-SUVW]\d{7}[0-9A-Z]\b'
+    # Los tres patrones son disjuntos, por lo que una única pasada con grupos con nombre
+    # encuentra las mismas coincidencias que tres búsquedas independientes.
+    _PATRON_COMBINADO = re.compile(f'(?P<DNI>{PATRON_DNI})|(?P<NIE>{PATRON_NIE})|(?P<NIF>{PATRON_NIF})')
+    # Dígito de control del NIF: letra equivalente a cada dígito, suma de las cifras del doble
+    # de cada dígito, y tipos de entidad que exigen letra o dígito (el resto admite ambos)
+    _NIF_LETRAS = 'JABCDEFGHI'
+    _NIF_DOBLES = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
+    _NIF_CONTROL_LETRA = frozenset('NPQRSW')
+    _NIF_CONTROL_DIGITO = frozenset('ABEH')
+    # Por debajo de este número de páginas no compensa abrir el PDF una vez por hilo
+    _MIN_PAGINAS_PARALELO = 16
+    _CLEAN_RE = re.compile(r'[\s.-]')
+    _DNI_RE = re.compile(r'^\d{8}[A-Z]$')
+    _NIE_RE = re.compile(r'^[XYZ]\d{7}[A-Z]$')
+    _NIF_RE = re.compile(r'^[A-HJNP-SUVW]\d{7}[0-9A-Z]$')
 
     def __init__(self):
         self.stats = {
@@ -94,19 +134,67 @@ class DocumentValidator:
             'nif_validos': 0,
             'docs_invalidos': 0
         }
+        self._session = None
 
-    @staticmethod
-    def clean_document(doc: str) -> str:
-        return re.sub(r'[\s.-]', '', doc).upper()
+    @property
+    def session(self):
+        """
+        Sesión HTTP reutilizable para mantener las conexiones abiertas entre descargas.
+        Se crea en el primer uso para no importar requests al arrancar.
+        """
+        if self._session is None:
+            # Importar requests para realizar peticiones HTTP
+            # Documentación: https://docs.python-requests.org/en/latest/
+            import requests
+            from requests.adapters import HTTPAdapter
+
+            # Importar Retry de urllib3 (dependencia de requests) para reintentar descargas fallidas
+            # Documentación: https://urllib3.readthedocs.io/en/stable/reference/urllib3.util.html
+            from urllib3.util.retry import Retry
+
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8,
+                pool_maxsize=8,
+                max_retries=Retry(total=3, backoff_factor=0.3)
+            )
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        return self._session
+
+    @classmethod
+    def clean_document(cls, doc: str) -> str:
+        return cls._CLEAN_RE.sub('', doc).upper()
+
+    @classmethod
+    def _validate_dni_fast(cls, numbers: str, letter: str) -> bool:
+        return ord(letter) == cls._LETRAS[int(numbers) % 23]
+
+    @classmethod
+    def _validate_nie_fast(cls, body: str, letter: str) -> bool:
+        # X, Y y Z equivalen a 0, 1 y 2 como primer dígito del número
+        numero = (ord(body[0]) - ord('X')) * 10_000_000 + int(body[1:])
+        return ord(letter) == cls._LETRAS[numero % 23]
+
+    @classmethod
+    def _validate_nif_fast(cls, body: str, control: str) -> bool:
+        # Las cifras en posición impar se doblan y se suman sus dígitos; las pares se suman tal cual
+        digitos = body[1:]
+        suma = sum(cls._NIF_DOBLES[int(d)] for d in digitos[::2]) + sum(int(d) for d in digitos[1::2])
+        digito = (10 - suma % 10) % 10
+        if body[0] in cls._NIF_CONTROL_LETRA:
+            return control == cls._NIF_LETRAS[digito]
+        if body[0] in cls._NIF_CONTROL_DIGITO:
+            return control == str(digito)
+        return control == str(digito) or control == cls._NIF_LETRAS[digito]
 
     @classmethod
     def validate_dni(cls, dni: str) -> bool:
         dni = cls.clean_document(dni)
         try:
-            if not re.match(r'^\d{8}[A-Z]$', dni):
+            if not cls._DNI_RE.match(dni):
                 return False
-            numbers, letter = dni[:-1], dni[-1]
-            return letter == cls.LETRAS_VALIDACION[int(numbers) % 23]
+            return cls._validate_dni_fast(dni[:-1], dni[-1])
         except (IndexError, ValueError):
             return False
 
@@ -114,165 +202,334 @@ class DocumentValidator:
     def validate_nie(cls, nie: str) -> bool:
         nie = cls.clean_document(nie)
         try:
-            if not re.match(r'^[XYZ]\d{7}[A-Z]$', nie):
+            if not cls._NIE_RE.match(nie):
                 return False
-            prefix = {'X': '0', 'Y': '1', 'Z': '2'}
-            numbers = prefix[nie[0]] + nie[1:-1]
-            return nie[-1] == cls.LETRAS_VALIDACION[int(numbers) % 23]
-        except (IndexError, ValueError, KeyError):
+            return cls._validate_nie_fast(nie[:-1], nie[-1])
+        except (IndexError, ValueError):
             return False
 
     @classmethod
     def validate_nif(cls, nif: str) -> bool:
         nif = cls.clean_document(nif)
-        return bool(re.match(r'^[A-HJNP-SUVW]\d{7}[0-9A-Z]$', nif))
+        try:
+            if not cls._NIF_RE.match(nif):
+                return False
+            return cls._validate_nif_fast(nif[:-1], nif[-1])
+        except (IndexError, ValueError):
+            return False
 
-    def download_pdf(self, url: str, output_path: str) -> bool:
+    def download_pdf(self, url: str, output_path: Union[str, BinaryIO]) -> bool:
         """
-        Descarga un archivo PDF desde una URL y lo guarda en la ruta especificada.
+        Descarga un archivo PDF desde una URL y lo guarda en la ruta o el objeto de archivo especificado.
 
         Args:
             url (str): URL del archivo PDF.
-            output_path (str): Ruta de salida para guardar el archivo PDF.
+            output_path (str | BinaryIO): Ruta de salida o objeto de archivo binario (por ejemplo io.BytesIO) donde guardar el PDF.
 
         Returns:
             bool: True si la descarga fue exitosa, False si hubo un error.
         """
         try:
-            response = requests.get(url, timeout=30)
-            response.raise_for_status()
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            # Descargar en streaming para no mantener el PDF completo en memoria
+            with self.session.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                if isinstance(output_path, str):
+                    with open(output_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+                else:
+                    shutil.copyfileobj(response.raw, output_path, length=1024 * 1024)
             return True
         except Exception as e:
             logging.error(f"Error descargando el PDF: {str(e)}")
             return False
 
-    def process_pdf(self, source: str, is_url: bool = False) -> List[Dict]:
+    @classmethod
+    def _extraer_paginas(cls, pdf: Any, abrir: Callable[[], Any], max_hilos: int = 1) -> Iterator[str]:
+        """
+        Extrae el texto de las páginas de un PDF con pdfplumber, devolviéndolo en orden.
+
+        Por defecto las páginas se recorren en un único hilo con el documento ya abierto:
+        pdfminer es Python puro y retiene el GIL, así que repartirlas entre hilos no ha
+        mostrado mejora. Con max_hilos > 1, los PDF grandes se reparten entre varios
+        hilos; el primero reutiliza ese documento y cada uno de los demás abre su
+        propio manejador, ya que los objetos de página no son seguros para compartir
+        entre hilos. Solo se mantienen en vuelo unas pocas páginas por hilo y cada
+        página se cierra tras extraer su texto, para no acumular en memoria el
+        documento completo.
+
+        Args:
+            pdf: Documento ya abierto con pdfplumber. Se cierra al terminar.
+            abrir: Función que abre un nuevo documento pdfplumber sobre el mismo PDF.
+            max_hilos (int): Número máximo de hilos. Por defecto, 1 (extracción secuencial).
+
+        Yields:
+            str: Texto de cada página, en el orden original.
+        """
+        def extraer_texto(pagina: Any) -> str:
+            # Cerrar la página libera los objetos de maquetación que pdfplumber guarda en caché
+            try:
+                return pagina.extract_text() or ""
+            finally:
+                pagina.close()
+
+        total_paginas = len(pdf.pages)
+        max_hilos = min(total_paginas, max_hilos)
+        documentos = [pdf]
+        try:
+            if total_paginas < cls._MIN_PAGINAS_PARALELO or max_hilos <= 1:
+                for pagina in pdf.pages:
+                    yield extraer_texto(pagina)
+                return
+
+            local = threading.local()
+            disponibles = [pdf]
+            cerrojo = threading.Lock()
+
+            def extraer(indice: int) -> str:
+                if not hasattr(local, 'pdf'):
+                    with cerrojo:
+                        local.pdf = disponibles.pop() if disponibles else None
+                    if local.pdf is None:
+                        local.pdf = abrir()
+                        with cerrojo:
+                            documentos.append(local.pdf)
+                return extraer_texto(local.pdf.pages[indice])
+
+            with ThreadPoolExecutor(max_workers=max_hilos) as executor:
+                pendientes = deque()
+                for indice in range(total_paginas):
+                    pendientes.append(executor.submit(extraer, indice))
+                    if len(pendientes) >= 2 * max_hilos:
+                        yield pendientes.popleft().result()
+                while pendientes:
+                    yield pendientes.popleft().result()
+        finally:
+            for documento in documentos:
+                documento.close()
+
+    @staticmethod
+    def _extraer_paginas_pdfium(pdf: Any) -> Iterator[str]:
+        """
+        Extrae secuencialmente el texto de las páginas de un documento de pypdfium2.
+
+        PDFium no admite llamadas concurrentes ni siquiera sobre documentos distintos,
+        así que este método recorre las páginas en un único hilo.
+
+        Args:
+            pdf: Documento abierto con pypdfium2.
+
+        Yields:
+            str: Texto de cada página, en el orden original.
+        """
+        for indice in range(len(pdf)):
+            pagina = pdf[indice]
+            textpage = pagina.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                pagina.close()
+
+    def _buscar_documentos(self, paginas: Iterator[str], total_paginas: int, verbose: bool = True) -> List[Dict]:
+        """
+        Busca y valida documentos de identidad en el texto de cada página a medida que se extrae.
+
+        La extracción se ejecuta en un hilo productor que deja el texto de cada página en
+        una cola acotada, mientras el hilo actual lo analiza con el patrón combinado, de
+        modo que extracción y búsqueda se solapan.
+
+        Args:
+            paginas: Iterador con el texto de cada página.
+            total_paginas (int): Número total de páginas del PDF.
+            verbose (bool): Si es True, muestra el progreso por página.
+
+        Returns:
+            List[Dict]: Lista de documentos encontrados.
+        """
+        cola = queue.Queue(maxsize=8)
+        fin = object()
+
+        def productor():
+            try:
+                for texto in paginas:
+                    cola.put(texto)
+            except Exception as e:
+                cola.put(e)
+            finally:
+                cola.put(fin)
+
+        hilo = threading.Thread(target=productor, daemon=True)
+        hilo.start()
+
+        # Las coincidencias ya cumplen el formato de su tipo y no pueden contener espacios,
+        # puntos ni guiones, así que se validan directamente sin limpiarlas ni comprobarlas con regex
+        validadores = {
+            'DNI': self._validate_dni_fast,
+            'NIE': self._validate_nie_fast,
+            'NIF': self._validate_nif_fast
+        }
+        # Los documentos suelen repetirse (cabeceras, pies de página...), así que
+        # cada documento distinto se valida una sola vez
+        vistos = {}
+        resultados = []
+        error = None
+        procesadas = 0
+        ultima_actualizacion = 0.0
+
+        while (texto := cola.get()) is not fin:
+            if isinstance(texto, Exception):
+                error = texto
+                continue
+
+            # Limitar las actualizaciones del progreso a una cada 100 ms
+            procesadas += 1
+            ahora = time.monotonic()
+            if verbose and (ahora - ultima_actualizacion > 0.1 or procesadas == total_paginas):
+                print(f"\rProcesando página {procesadas}/{total_paginas}...", end="", flush=True)
+                ultima_actualizacion = ahora
+            for match in self._PATRON_COMBINADO.finditer(texto):
+                tipo = match.lastgroup
+                doc = match.group()
+                es_valido = vistos.get(doc)
+                if es_valido is None:
+                    es_valido = vistos[doc] = validadores[tipo](doc[:-1], doc[-1])
+
+                resultados.append({
+                    'tipo': tipo,
+                    'documento': doc,
+                    'documento_limpio': doc,
+                    'valido': es_valido
+                })
+
+        hilo.join()
+        if error is not None:
+            raise error
+        return resultados
+
+    def process_pdf(self, source: str, is_url: bool = False, max_hilos: int = 1,
+                    verbose: bool = True) -> List[Dict]:
         """
         Procesa un archivo PDF para extraer y validar documentos de identidad españoles.
 
         Args:
             source (str): Ruta del archivo PDF o URL del archivo PDF.
             is_url (bool): Indica si la fuente es una URL.
+            max_hilos (int): Número máximo de hilos para extraer páginas. Por defecto, 1 (extracción secuencial).
+            verbose (bool): Si es True, muestra el progreso en la terminal. Los errores se muestran siempre.
 
         Returns:
             List[Dict]: Lista de resultados del análisis.
         """
-        temp_pdf = "temp_download.pdf" if is_url else source
         resultados = []
+        datos = None
 
         try:
             if is_url:
-                print(f"{Fore.YELLOW}⌛ Descargando PDF...{Style.RESET_ALL}")
-                if not self.download_pdf(source, temp_pdf):
-                    print(f"{Fore.RED}✗ Error descargando el PDF{Style.RESET_ALL}")
+                # Descargar a memoria: pdfplumber acepta objetos de archivo, así que no hace falta un archivo temporal
+                if verbose:
+                    print(f"{Fore.YELLOW}⌛ Descargando PDF...{Style.RESET_ALL}")
+                buffer = io.BytesIO()
+                if not self.download_pdf(source, buffer):
+                    print(f"{Fore.RED}✗ Error descargando el PDF: {source}{Style.RESET_ALL}")
                     return resultados
+                datos = buffer.getvalue()
 
-            print(f"{Fore.YELLOW}⌛ Extrayendo texto...{Style.RESET_ALL}")
+            if verbose:
+                print(f"{Fore.YELLOW}⌛ Extrayendo texto y buscando documentos...{Style.RESET_ALL}")
             try:
-                with pdfplumber.open(temp_pdf) as pdf:
-                    texto = ""
+                # Importar pdfplumber para extraer texto de PDFs (método principal)
+                # Documentación: https://github.com/jsvine/pdfplumber
+                import pdfplumber
+
+                # Cada hilo necesita su propio flujo sobre los mismos bytes descargados
+                def abrir_pdfplumber():
+                    return pdfplumber.open(io.BytesIO(datos) if is_url else source)
+
+                pdf = abrir_pdfplumber()
+                try:
                     total_paginas = len(pdf.pages)
-                    for i, pagina in enumerate(pdf.pages, 1):
-                        print(f"\rProcesando página {i}/{total_paginas}...", end="", flush=True)
-                        texto += pagina.extract_text() or ""
+                except Exception:
+                    pdf.close()
+                    raise
+                resultados = self._buscar_documentos(
+                    self._extraer_paginas(pdf, abrir_pdfplumber, max_hilos), total_paginas, verbose
+                )
+                if verbose:
                     print(f"\n{Fore.GREEN}✓ Texto extraído con éxito{Style.RESET_ALL}")
 
             except Exception as e:
-                print(f"{Fore.YELLOW}⌛ Intentando método alternativo...{Style.RESET_ALL}")
-                with open(temp_pdf, 'rb') as archivo:
-                    reader = PdfFileReader(archivo)
-                    texto = ""
-                    total_paginas = len(reader.pages)
-                    for i, pagina in enumerate(reader.pages, 1):
-                        print(f"\rProcesando página {i}/{total_paginas}...", end="", flush=True)
-                        texto += pagina.extract_text() or ""
+                # Se descartan los resultados parciales para no duplicarlos al reintentar
+                if verbose:
+                    print(f"\n{Fore.YELLOW}⌛ Intentando método alternativo...{Style.RESET_ALL}")
+
+                # Importar pypdfium2 para extraer texto de PDFs (método alternativo)
+                # Documentación: https://pypdfium2.readthedocs.io/en/stable/
+                import pypdfium2 as pdfium
+
+                pdf = pdfium.PdfDocument(datos if is_url else source)
+                try:
+                    resultados = self._buscar_documentos(self._extraer_paginas_pdfium(pdf), len(pdf), verbose)
+                finally:
+                    pdf.close()
+                if verbose:
                     print(f"\n{Fore.GREEN}✓ Texto extraído con éxito{Style.RESET_ALL}")
 
-            print(f"{Fore.YELLOW}⌛ Buscando documentos...{Style.RESET_ALL}")
-            for patron, tipo in [
-                (self.PATRON_DNI, 'DNI'),
-                (self.PATRON_NIE, 'NIE'),
-                (self.PATRON_NIF, 'NIF')
-            ]:
-                coincidencias = list(re.finditer(patron, texto))
-                if coincidencias:
-                    print(f"{Fore.CYAN}Se encontraron {len(coincidencias)} {tipo}(s){Style.RESET_ALL}")
-
-                for match in coincidencias:
-                    doc = match.group()
-                    doc_limpio = self.clean_document(doc)
-
-                    es_valido = False
-                    if tipo == 'DNI':
-                        es_valido = self.validate_dni(doc_limpio)
-                        if es_valido:
-                            self.stats['dni_validos'] += 1
-                    elif tipo == 'NIE':
-                        es_valido = self.validate_nie(doc_limpio)
-                        if es_valido:
-                            self.stats['nie_validos'] += 1
-                    elif tipo == 'NIF':
-                        es_valido = self.validate_nif(doc_limpio)
-                        if es_valido:
-                            self.stats['nif_validos'] += 1
-
-                    if not es_valido:
-                        self.stats['docs_invalidos'] += 1
-
-                    resultados.append({
-                        'tipo': tipo,
-                        'documento': doc,
-                        'documento_limpio': doc_limpio,
-                        'valido': es_valido
-                    })
+            encontrados = dict.fromkeys(('DNI', 'NIE', 'NIF'), 0)
+            for resultado in resultados:
+                encontrados[resultado['tipo']] += 1
+                if resultado['valido']:
+                    self.stats[f"{resultado['tipo'].lower()}_validos"] += 1
+                else:
+                    self.stats['docs_invalidos'] += 1
+
+            for tipo, cantidad in encontrados.items():
+                if verbose and cantidad:
+                    print(f"{Fore.CYAN}Se encontraron {cantidad} {tipo}(s){Style.RESET_ALL}")
 
             self.stats['archivos_procesados'] += 1
             return resultados
 
         except Exception as e:
-            print(f"{Fore.RED}Error procesando el PDF: {str(e)}{Style.RESET_ALL}")
+            print(f"{Fore.RED}Error procesando el PDF {source}: {str(e)}{Style.RESET_ALL}")
             return resultados
 
-        finally:
-            if is_url and Path(temp_pdf).exists():
-                try:
-                    Path(temp_pdf).unlink()
-                    print(f"{Fore.GREEN}✓ Archivo temporal eliminado{Style.RESET_ALL}")
-                except Exception as e:
-                    print(f"{Fore.RED}Error eliminando el archivo temporal: {str(e)}{Style.RESET_ALL}")
-
-    def save_results(self, resultados: List[Dict], archivo: str):
+    def save_results(self, resultados: List[Dict], archivo: str, verbose: bool = False):
         """
         Guardar los resultados en un archivo CSV.
 
         Args:
             resultados: Lista de documentos encontrados.
             archivo: Nombre del archivo CSV de salida.
+            verbose: Si es True, muestra también cada resultado en la terminal. El menú
+                interactivo no lo activa, ya que los resultados se muestran al terminar el
+                análisis; está pensado para quien use DocumentValidator desde su propio código.
         """
         try:
             with open(archivo, 'w', newline='', encoding='utf-8') as f:
                 fieldnames = ['Tipo', 'Documento', 'Documento Limpio', 'Valido']
                 writer = csv.DictWriter(f, fieldnames=fieldnames)
                 writer.writeheader()
-                for resultado in resultados:
-                    valido = 'Sí' if resultado['valido'] else 'No'
-                    simbolo = '✓' if resultado['valido'] else '⚠'
-                    writer.writerow({
-                        'Tipo': resultado['tipo'],
-                        'Documento': resultado['documento'],
-                        'Documento Limpio': resultado['documento_limpio'],
-                        'Valido': f"{simbolo} {valido}"
-                    })
-                    
-                    # Mostrar en la terminal con colores
-                    estado_color = Fore.GREEN if resultado['valido'] else Fore.RED
-                    print(f"{Fore.CYAN}Tipo: {Style.RESET_ALL}{resultado['tipo']}")
-                    print(f"{Fore.CYAN}Documento: {Style.RESET_ALL}{resultado['documento']}")
-                    print(f"{Fore.CYAN}Documento Limpio: {Style.RESET_ALL}{resultado['documento_limpio']}")
-                    print(f"{Fore.CYAN}Valido: {estado_color}{simbolo} {valido}{Style.RESET_ALL}")
-                    print()
+                writer.writerows({
+                    'Tipo': resultado['tipo'],
+                    'Documento': resultado['documento'],
+                    'Documento Limpio': resultado['documento_limpio'],
+                    'Valido': f"{'✓' if resultado['valido'] else '⚠'} {'Sí' if resultado['valido'] else 'No'}"
+                } for resultado in resultados)
+
+                if verbose:
+                    # Mostrar en la terminal con colores, en una única escritura
+                    lineas = []
+                    for resultado in resultados:
+                        estado_color = Fore.GREEN if resultado['valido'] else Fore.RED
+                        estado = f"{'✓' if resultado['valido'] else '⚠'} {'Sí' if resultado['valido'] else 'No'}"
+                        lineas.append(
+                            f"{Fore.CYAN}Tipo: {Style.RESET_ALL}{resultado['tipo']}\n"
+                            f"{Fore.CYAN}Documento: {Style.RESET_ALL}{resultado['documento']}\n"
+                            f"{Fore.CYAN}Documento Limpio: {Style.RESET_ALL}{resultado['documento_limpio']}\n"
+                            f"{Fore.CYAN}Valido: {estado_color}{estado}{Style.RESET_ALL}\n\n"
+                        )
+                    sys.stdout.write("".join(lineas))
 
                 # Agregar resumen al final del archivo CSV
                 writer.writerow({})
@@ -333,6 +590,29 @@ def mostrar_menu() -> int:
         except ValueError:
             print(f"{Fore.RED}Error: Por favor ingrese un número válido{Style.RESET_ALL}")
 
+# Patrón precompilado de caracteres no permitidos en las rutas (usado por sanitize_path)
+_SANITIZE_RE = re.compile(r'[^\w\s/\\\.\_\-\:\~\(\)áéíóúÁÉÍÓÚ]')
+
+# Extensiones de archivo que se pueden analizar
+_EXTENSIONES_PERMITIDAS = frozenset({'.pdf'})
+
+def dividir_rutas(input_str: str) -> List[str]:
+    """
+    Divide la entrada del usuario en rutas, separadas por espacios o comas, respetando las comillas.
+
+    Args:
+        input_str (str): Texto introducido o arrastrado al terminal.
+
+    Returns:
+        List[str]: Lista de rutas.
+    """
+    lexer = shlex.shlex(input_str, posix=True)
+    lexer.whitespace += ','
+    lexer.whitespace_split = True
+    # Igual que shlex.split: '#' forma parte de la ruta y no inicia un comentario
+    lexer.commenters = ''
+    return list(lexer)
+
 def sanitize_path(path: str) -> str:
     """
     Limpia la ruta del archivo eliminando caracteres no permitidos que puedan interferir con el análisis.
@@ -348,7 +628,7 @@ def sanitize_path(path: str) -> str:
 
     # Eliminar caracteres no deseados utilizando una expresión regular
     # Permitimos letras, números, espacios y los símbolos / \ . _ - : ~ ( ) á é í ó ú Á É Í Ó Ú
-    path = re.sub(r'[^\w\s/\\\.\_\-\:\~\(\)áéíóúÁÉÍÓÚ]', '', path)
+    path = _SANITIZE_RE.sub('', path)
 
     # Expandir ruta de usuario (manejar '~' correctamente)
     path = os.path.expanduser(path)
@@ -372,20 +652,20 @@ def analizar_archivo(validador: DocumentValidator) -> List[Dict]:
     input_str = input().strip()
 
     # Usar shlex para dividir correctamente la entrada
-    tokens = shlex.split(input_str)
+    tokens = dividir_rutas(input_str)
     if not tokens:
         print(f"{Fore.RED}Error: No se ingresó ninguna ruta de archivo{Style.RESET_ALL}")
         return []
 
     ruta_archivo = tokens[0]
     ruta_archivo = sanitize_path(ruta_archivo)
+    ruta = Path(ruta_archivo)
 
-    if not Path(ruta_archivo).is_file():
+    if not ruta.is_file():
         print(f"{Fore.RED}Error: El archivo no existe o la ruta es incorrecta:{Style.RESET_ALL} {ruta_archivo}")
         return []
 
-    ext = Path(ruta_archivo).suffix.lower()
-    if ext == '.pdf':
+    if ruta.suffix.lower() in _EXTENSIONES_PERMITIDAS:
         print(f"\n{Fore.YELLOW}⌛ Analizando documento PDF...{Style.RESET_ALL}")
         resultados = validador.process_pdf(ruta_archivo)
     else:
@@ -401,6 +681,23 @@ def analizar_archivo(validador: DocumentValidator) -> List[Dict]:
         print(f"{Fore.RED}No se encontraron documentos.{Style.RESET_ALL}")
     return resultados
 
+def _procesar_pdf_en_proceso(ruta_archivo: str) -> Tuple[List[Dict], Dict]:
+    """
+    Procesa un archivo PDF en un proceso independiente.
+
+    Cada proceso usa un solo hilo, ya que el paralelismo viene del número de procesos,
+    y no muestra el progreso para no mezclar su salida con la de los demás.
+
+    Args:
+        ruta_archivo (str): Ruta del archivo PDF.
+
+    Returns:
+        Tuple[List[Dict], Dict]: Resultados del análisis y estadísticas del proceso.
+    """
+    validador = DocumentValidator()
+    resultados = validador.process_pdf(ruta_archivo, max_hilos=1, verbose=False)
+    return resultados, validador.stats
+
 def analizar_multiples_archivos(validador: DocumentValidator) -> List[Dict]:
     """
     Analiza múltiples archivos PDF locales o arrastrados al terminal.
@@ -415,30 +712,50 @@ def analizar_multiples_archivos(validador: DocumentValidator) -> List[Dict]:
     input_str = input().strip()
 
     # Usar shlex para dividir correctamente la entrada
-    tokens = shlex.split(input_str)
+    tokens = dividir_rutas(input_str)
     rutas_archivos = [sanitize_path(ruta) for ruta in tokens]
+    rutas_pdf = []
     resultados_totales = []
 
     for ruta_archivo in rutas_archivos:
-        if not Path(ruta_archivo).is_file():
+        ruta = Path(ruta_archivo)
+        if not ruta.is_file():
             print(f"{Fore.RED}Error: El archivo no existe o la ruta es incorrecta:{Style.RESET_ALL} {ruta_archivo}")
             continue
 
-        ext = Path(ruta_archivo).suffix.lower()
-        if ext == '.pdf':
-            print(f"\n{Fore.YELLOW}⌛ Analizando documento PDF: {ruta_archivo}...{Style.RESET_ALL}")
-            resultados = validador.process_pdf(ruta_archivo)
-            if resultados:
-                print(f"\n{Fore.GREEN}✓ Se encontraron {len(resultados)} documentos en {ruta_archivo}:{Style.RESET_ALL}")
-                for doc in resultados:
-                    estado = f"{Fore.GREEN}✓{Style.RESET_ALL}" if doc['valido'] else f"{Fore.RED}⚠{Style.RESET_ALL}"
-                    print(f"{estado} {doc['tipo']}: {doc['documento']}")
-                resultados_totales.extend(resultados)
-            else:
-                print(f"{Fore.RED}No se encontraron documentos en {ruta_archivo}.{Style.RESET_ALL}")
+        if ruta.suffix.lower() in _EXTENSIONES_PERMITIDAS:
+            rutas_pdf.append(ruta_archivo)
         else:
             print(f"{Fore.RED}Error: Solo se admiten archivos PDF: {ruta_archivo}{Style.RESET_ALL}")
 
+    if not rutas_pdf:
+        return resultados_totales
+
+    def mostrar_resultados(ruta_archivo: str, resultados: List[Dict]):
+        if resultados:
+            print(f"\n{Fore.GREEN}✓ Se encontraron {len(resultados)} documentos en {ruta_archivo}:{Style.RESET_ALL}")
+            for doc in resultados:
+                estado = f"{Fore.GREEN}✓{Style.RESET_ALL}" if doc['valido'] else f"{Fore.RED}⚠{Style.RESET_ALL}"
+                print(f"{estado} {doc['tipo']}: {doc['documento']}")
+            resultados_totales.extend(resultados)
+        else:
+            print(f"{Fore.RED}No se encontraron documentos en {ruta_archivo}.{Style.RESET_ALL}")
+
+    if len(rutas_pdf) == 1:
+        # Un único archivo se analiza en este proceso, sin el coste de arrancar otro
+        print(f"\n{Fore.YELLOW}⌛ Analizando documento PDF: {rutas_pdf[0]}...{Style.RESET_ALL}")
+        mostrar_resultados(rutas_pdf[0], validador.process_pdf(rutas_pdf[0]))
+        return resultados_totales
+
+    # Analizar los archivos en paralelo, cada uno en su propio proceso
+    print(f"\n{Fore.YELLOW}⌛ Analizando {len(rutas_pdf)} documentos PDF...{Style.RESET_ALL}")
+    max_procesos = min(len(rutas_pdf), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_procesos) as executor:
+        for ruta_archivo, (resultados, stats) in zip(rutas_pdf, executor.map(_procesar_pdf_en_proceso, rutas_pdf)):
+            for clave, valor in stats.items():
+                validador.stats[clave] += valor
+            mostrar_resultados(ruta_archivo, resultados)
+
     return resultados_totales
 
 def exportar_resultados(validador: DocumentValidator, resultados: List[Dict]):